@@ -8,69 +8,72 @@ to create and play a text adventure game.
 
 import asyncio
 from llmadventure.core.game import Game
+from llmadventure.engine.llm_interface import LLMInterface
 from llmadventure.utils.config import Config
 from llmadventure.utils.logger import logger
 
 
-async def basic_game_example():
-    """Demonstrate basic game functionality"""
-    
-    print("🎮 LLMAdventure Basic Example")
-    print("=" * 40)
+def tagged_printer(tag: str):
+    """Return a print function that prefixes each line with the scenario name"""
+    def say(message: str = ""):
+        for line in message.split("\n"):
+            print(f"[{tag}] {line}" if line else "")
+    return say
 
-    config = Config()
 
-    if not config.get_api_key():
-        print("❌ No Google API key found!")
-        print("Please set your GOOGLE_API_KEY environment variable")
-        return
+async def basic_game_example(config: Config, llm: LLMInterface):
+    """Demonstrate basic game functionality"""
+    say = tagged_printer("basic")
+    
+    say("🎮 LLMAdventure Basic Example")
+    say("=" * 40)
 
-    game = Game(config)
+    game = Game(config, llm)
     
     try:
-        print("🚀 Starting new game...")
+        say("🚀 Starting new game...")
         await game.initialize_new_game("Hero", "warrior")
         
-        print(f"✅ Game started! Welcome, {game.player.name}!")
-        print(f"📍 Starting location: {game.player.location}")
-        print(f"⚔️  Class: {game.player.player_class.value}")
-        print(f"❤️  Health: {game.player.health}/{game.player.max_health}")
+        say(f"✅ Game started! Welcome, {game.player.name}!")
+        say(f"📍 Starting location: {game.player.location}")
+        say(f"⚔️  Class: {game.player.player_class.value}")
+        say(f"❤️  Health: {game.player.health}/{game.player.max_health}")
 
-        print("\n👀 Looking around...")
+        say("\n👀 Looking around...")
         await game.look_around()
 
-        print("\n🚶 Moving north...")
+        say("\n🚶 Moving north...")
         await game.move_player("north")
         
-        print("\n👀 Looking around again...")
+        say("\n👀 Looking around again...")
         await game.look_around()
 
-        print("\n📊 Player Status:")
-        print(f"   Health: {game.player.health}/{game.player.max_health}")
-        print(f"   Level: {game.player.level}")
-        print(f"   Experience: {game.player.experience}")
-        print(f"   Location: {game.player.location}")
+        say("\n📊 Player Status:")
+        say(f"   Health: {game.player.health}/{game.player.max_health}")
+        say(f"   Level: {game.player.level}")
+        say(f"   Experience: {game.player.experience}")
+        say(f"   Location: {game.player.location}")
 
-        print("\n💾 Saving game...")
+        say("\n💾 Saving game...")
         await game.save_game("example_save")
-        print("✅ Game saved!")
+        say("✅ Game saved!")
 
         state = game.get_game_state()
-        print(f"\n📋 Game State Keys: {list(state.keys())}")
+        say(f"\n📋 Game State Keys: {list(state.keys())}")
         
     except Exception as e:
         logger.error(f"Error in basic example: {e}")
-        print(f"❌ Error: {e}")
+        say(f"❌ Error: {e}")
 
 
-async def combat_example():
+async def combat_example(config: Config, llm: LLMInterface):
     """Demonstrate combat functionality"""
+    say = tagged_printer("combat")
     
-    print("\n⚔️ Combat Example")
-    print("=" * 40)
+    say("\n⚔️ Combat Example")
+    say("=" * 40)
     
-    config = Config()
-    game = Game(config)
+    game = Game(config, llm)
     
     try:
         await game.initialize_new_game("Fighter", "warrior")
@@ -79,24 +82,24 @@ async def combat_example():
 
         if game.creatures_at_location:
             creature = game.creatures_at_location[0]
-            print(f"\n⚔️ Attacking {creature.name}...")
+            say(f"\n⚔️ Attacking {creature.name}...")
             await game.attack_creature(creature.name)
         else:
-            print("😴 No creatures to fight here...")
+            say("😴 No creatures to fight here...")
             
     except Exception as e:
         logger.error(f"Error in combat example: {e}")
-        print(f"❌ Error: {e}")
+        say(f"❌ Error: {e}")
 
 
-async def inventory_example():
+async def inventory_example(config: Config, llm: LLMInterface):
     """Demonstrate inventory management"""
+    say = tagged_printer("inventory")
     
-    print("\n🎒 Inventory Example")
-    print("=" * 40)
+    say("\n🎒 Inventory Example")
+    say("=" * 40)
     
-    config = Config()
-    game = Game(config)
+    game = Game(config, llm)
     
     try:
         await game.initialize_new_game("Collector", "rogue")
@@ -105,28 +108,28 @@ async def inventory_example():
 
         if game.items_at_location:
             item = game.items_at_location[0]
-            print(f"\n🛍️ Taking {item.name}...")
+            say(f"\n🛍️ Taking {item.name}...")
             await game.take_item(item.name)
 
-            print("\n🎒 Inventory:")
+            say("\n🎒 Inventory:")
             for item in game.player.inventory.items:
-                print(f"   - {item.name}: {item.description}")
+                say(f"   - {item.name}: {item.description}")
         else:
-            print("📦 No items to collect here...")
+            say("📦 No items to collect here...")
             
     except Exception as e:
         logger.error(f"Error in inventory example: {e}")
-        print(f"❌ Error: {e}")
+        say(f"❌ Error: {e}")
 
 
-async def quest_example():
+async def quest_example(config: Config, llm: LLMInterface):
     """Demonstrate quest system"""
+    say = tagged_printer("quest")
     
-    print("\n📜 Quest Example")
-    print("=" * 40)
+    say("\n📜 Quest Example")
+    say("=" * 40)
     
-    config = Config()
-    game = Game(config)
+    game = Game(config, llm)
     
     try:
         await game.initialize_new_game("Adventurer", "ranger")
@@ -134,15 +137,15 @@ async def quest_example():
         await game.look_around()
 
         if game.quests_available:
-            print("\n📜 Available Quests:")
+            say("\n📜 Available Quests:")
             for quest in game.quests_available:
-                print(f"   - {quest.title}: {quest.description}")
+                say(f"   - {quest.title}: {quest.description}")
         else:
-            print("📋 No quests available here...")
+            say("📋 No quests available here...")
             
     except Exception as e:
         logger.error(f"Error in quest example: {e}")
-        print(f"❌ Error: {e}")
+        say(f"❌ Error: {e}")
 
 
 async def main():
@@ -151,13 +154,29 @@ async def main():
     print("🎮 LLMAdventure Examples")
     print("=" * 50)
 
-    await basic_game_example()
-
-    await combat_example()
+    config = Config()
 
-    await inventory_example()
+    if not config.get_api_key():
+        print("❌ No Google API key found!")
+        print("Please set your GOOGLE_API_KEY environment variable")
+        return
 
-    await quest_example()
+    # Example runs repeat the same prompts, so serve repeats from the response
+    # cache; persist=False keeps this out of the user's saved settings
+    config.set("llm_cache_enabled", True, persist=False)
+
+    # One model client shared by every example instead of one per Game
+    llm = LLMInterface(config)
+
+    # Each example builds its own Game, so they can wait on the LLM concurrently
+    # Every example handles its own errors, so one failing does not stop the rest
+    await asyncio.gather(
+        basic_game_example(config, llm),
+        combat_example(config, llm),
+        inventory_example(config, llm),
+        quest_example(config, llm)
+    )
+    llm.close()
     
     print("\n🎉 Examples completed!")
     print("For more examples, check out the documentation at:")
@@ -7,14 +7,72 @@ to extend the game's functionality.
 """
 
 import asyncio
-from typing import Dict, Any
+import random
+from types import SimpleNamespace
+from typing import Dict, Any, List
+import numpy as np
 from llmadventure.plugins import Plugin, register_plugin
 from llmadventure.core.game import Game
-from llmadventure.core.player import Player
+from llmadventure.core.player import Player, PlayerClass
 from llmadventure.core.creature import Creature
 from llmadventure.core.quest import Quest
 
 
+# Stand-in for players without an active quest; matches no quest type
+_NO_QUEST = SimpleNamespace(quest_type=None)
+
+# Combat bonus = level * _LEVEL_BONUS, plus _WARRIOR_BONUS for warriors
+_LEVEL_BONUS = 2
+_WARRIOR_BONUS = 5
+
+_CLASS_ABILITIES = {
+    "warrior": ("Charge Attack", "Defensive Stance"),
+    "mage": ("Fireball", "Ice Shield"),
+    "rogue": ("Backstab", "Stealth"),
+    "ranger": ("Precise Shot", "Animal Companion"),
+}
+
+
+class PlayerTable:
+    """Structure-of-arrays store of the player fields used for combat bonuses"""
+    
+    def __init__(self, capacity: int = 8):
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.levels = np.zeros(capacity, dtype=np.int32)
+        self.is_warrior = np.zeros(capacity, dtype=np.bool_)
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def _grow(self):
+        # Double the capacity so inserting n players copies O(n) rows in total
+        capacity = max(1, 2 * len(self.levels))
+        levels = np.zeros(capacity, dtype=np.int32)
+        is_warrior = np.zeros(capacity, dtype=np.bool_)
+        levels[:len(self.names)] = self.levels[:len(self.names)]
+        is_warrior[:len(self.names)] = self.is_warrior[:len(self.names)]
+        self.levels, self.is_warrior = levels, is_warrior
+    
+    def update(self, player: Player) -> int:
+        """Insert or refresh a player's row and return its id"""
+        player_id = self.ids.get(player.name)
+        if player_id is None:
+            player_id = len(self.names)
+            if player_id == len(self.levels):
+                self._grow()
+            self.ids[player.name] = player_id
+            self.names.append(player.name)
+        self.levels[player_id] = player.level
+        self.is_warrior[player_id] = player.player_class.value == "warrior"
+        return player_id
+    
+    def combat_bonuses(self) -> np.ndarray:
+        """Combat bonus for every player in the table, indexed by player id"""
+        count = len(self.names)
+        return self.levels[:count] * _LEVEL_BONUS + self.is_warrior[:count] * _WARRIOR_BONUS
+
+
 @register_plugin
 class CombatEnhancerPlugin(Plugin):
     """Plugin that enhances combat mechanics"""
@@ -27,17 +85,21 @@ class CombatEnhancerPlugin(Plugin):
         super().__init__()
         self.combat_bonuses = {}
         self.special_abilities = {}
+        self.players = PlayerTable()
     
     def on_game_start(self, game: Game):
         """Initialize plugin when game starts"""
         print("⚔️ Combat Enhancer Plugin loaded!")
 
+        self.players.update(game.player)
         self._add_special_abilities(game.player)
     
     def on_combat_start(self, player: Player, enemy: Creature):
         """Called when combat begins"""
         print(f"🔥 Combat Enhancer: {player.name} vs {enemy.name}")
 
+        # Keep the player's row current; they may have levelled up since the last fight
+        self.players.update(player)
         bonus = self._calculate_combat_bonus(player)
         self.combat_bonuses[player.name] = bonus
         
@@ -59,28 +121,25 @@ class CombatEnhancerPlugin(Plugin):
     
     def _add_special_abilities(self, player: Player):
         """Add special abilities to player"""
-        abilities = {
-            "warrior": ["Charge Attack", "Defensive Stance"],
-            "mage": ["Fireball", "Ice Shield"],
-            "rogue": ["Backstab", "Stealth"],
-            "ranger": ["Precise Shot", "Animal Companion"]
-        }
-        
-        player_class = player.player_class.value
-        if player_class in abilities:
-            self.special_abilities[player.name] = abilities[player_class]
-            print(f"🎯 Special abilities added: {', '.join(abilities[player_class])}")
+        abilities = _CLASS_ABILITIES.get(player.player_class.value)
+        if abilities:
+            self.special_abilities[player.name] = abilities
+            print(f"🎯 Special abilities added: {', '.join(abilities)}")
     
     def _calculate_combat_bonus(self, player: Player) -> int:
         """Calculate combat bonus based on player stats"""
-        base_bonus = player.level * 2
+        base_bonus = player.level * _LEVEL_BONUS
         if player.player_class.value == "warrior":
-            base_bonus += 5
+            base_bonus += _WARRIOR_BONUS
         return base_bonus
     
+    def calculate_combat_bonuses(self) -> np.ndarray:
+        """Calculate combat bonuses for every tracked player in one pass"""
+        return self.players.combat_bonuses()
+    
     def _trigger_special_ability(self, player: Player, enemy: Creature):
         """Trigger a special ability"""
-        abilities = self.special_abilities.get(player.name, [])
+        abilities = self.special_abilities.get(player.name, ())
         if abilities:
             ability = abilities[0]
             print(f"✨ {player.name} uses {ability}!")
@@ -128,6 +187,16 @@ class QuestGeneratorPlugin(Plugin):
                 "reward_exp": 50
             }
         ]
+        # Descriptions only depend on the template, so format them once up front
+        self._prebuilt_quests = [
+            (template, template["description"].format(
+                count=template["target_count"],
+                creature_type="goblin",
+                item_type="treasure"
+            ))
+            for template in self.quest_templates
+        ]
+        self._rng = random.Random()
         self.active_quests = {}
     
     def on_game_start(self, game: Game):
@@ -149,16 +218,10 @@ class QuestGeneratorPlugin(Plugin):
     
     def _generate_starter_quest(self, player: Player):
         """Generate a starter quest for the player"""
-        import random
-        
-        template = random.choice(self.quest_templates)
+        template, description = self._rng.choice(self._prebuilt_quests)
         quest = Quest(
             title=template["title"],
-            description=template["description"].format(
-                count=template["target_count"],
-                creature_type="goblin",
-                item_type="treasure"
-            ),
+            description=description,
             quest_type=template["type"],
             target_count=template["target_count"],
             reward_exp=template["reward_exp"]
@@ -170,12 +233,12 @@ class QuestGeneratorPlugin(Plugin):
     
     def _update_quest_progress(self, player: Player, quest_type: str):
         """Update quest progress"""
-        quest = self.active_quests.get(player.name)
-        if quest and quest.quest_type == quest_type:
-            quest.progress += 1
+        quest = self.active_quests.get(player.name, _NO_QUEST)
+        if quest.quest_type == quest_type:
+            quest.progress = min(quest.progress + 1, quest.target_count)
             print(f"📈 Quest progress: {quest.progress}/{quest.target_count}")
             
-            if quest.progress >= quest.target_count:
+            if quest.progress == quest.target_count:
                 self._complete_quest(player, quest)
     
     def _complete_quest(self, player: Player, quest: Quest):
@@ -195,17 +258,19 @@ class WeatherPlugin(Plugin):
     version = "1.0.0"
     description = "Adds dynamic weather that affects gameplay"
     
+    weather_conditions = ("sunny", "rainy", "stormy", "foggy", "windy")
+    weather_effects = {
+        "sunny": {"combat_bonus": 0, "movement_bonus": 0},
+        "rainy": {"combat_bonus": -2, "movement_bonus": -1},
+        "stormy": {"combat_bonus": -5, "movement_bonus": -3},
+        "foggy": {"combat_bonus": -1, "movement_bonus": -2},
+        "windy": {"combat_bonus": 1, "movement_bonus": 1}
+    }
+    
     def __init__(self):
         super().__init__()
-        self.weather_conditions = ["sunny", "rainy", "stormy", "foggy", "windy"]
         self.current_weather = "sunny"
-        self.weather_effects = {
-            "sunny": {"combat_bonus": 0, "movement_bonus": 0},
-            "rainy": {"combat_bonus": -2, "movement_bonus": -1},
-            "stormy": {"combat_bonus": -5, "movement_bonus": -3},
-            "foggy": {"combat_bonus": -1, "movement_bonus": -2},
-            "windy": {"combat_bonus": 1, "movement_bonus": 1}
-        }
+        self._rng = random.Random()
     
     def on_game_start(self):
         """Initialize plugin when game starts"""
@@ -214,8 +279,7 @@ class WeatherPlugin(Plugin):
     
     def on_player_move(self):
         """Called when player moves"""
-        import random
-        if random.random() < 0.1:
+        if self._rng.random() < 0.1:
             self._change_weather()
     
     def on_combat_start(self):
@@ -226,9 +290,8 @@ class WeatherPlugin(Plugin):
     
     def _change_weather(self):
         """Change the weather condition"""
-        import random
         old_weather = self.current_weather
-        self.current_weather = random.choice(self.weather_conditions)
+        self.current_weather = self._rng.choice(self.weather_conditions)
         
         if old_weather != self.current_weather:
             print(f"🌤️ Weather changed: {old_weather} → {self.current_weather}")
@@ -255,6 +318,14 @@ async def main():
     print("   - Modular design")
     print("   - Hot-reloadable")
     
+    print("\n⚔️ Combat bonuses for a sample party:")
+    combat_enhancer = CombatEnhancerPlugin()
+    for player in (Player("Aria", PlayerClass.WARRIOR), Player("Bram", PlayerClass.MAGE)):
+        combat_enhancer.players.update(player)
+    bonuses = combat_enhancer.calculate_combat_bonuses()
+    for name, bonus in zip(combat_enhancer.players.names, bonuses):
+        print(f"   - {name}: +{bonus} attack")
+    
     print("\n📚 To use these plugins:")
     print("   1. Install LLMAdventure")
     print("   2. Create your plugin file")
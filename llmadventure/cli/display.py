@@ -290,7 +290,7 @@ class DisplayManager:
 • take [item] - Take an item from location
 
 [bold yellow]System Commands:[/bold yellow]
-• save, s - Save the game
+• save - Save the game
 • load - Load a saved game
 • quit, exit, q - Quit the game
 • help, h, ? - Show this help
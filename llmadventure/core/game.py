@@ -5,7 +5,7 @@ Main Game class for LLMAdventure
 import json
 import asyncio
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
 from .player import Player, PlayerClass
@@ -19,15 +19,78 @@ from ..utils.config import Config
 from ..utils.logger import logger
 
 
+class SaveCoalescer:
+    """Collapses save requests made within a short window into a single write"""
+
+    def __init__(self, save: Callable[[], Awaitable[None]], delay: float = 0.5):
+        self.save = save
+        self.delay = delay
+        self._timer = None
+        self._task = None
+        self._callbacks: List[Callable[[Optional[Exception]], None]] = []
+
+    def request_save(self, on_done: Optional[Callable[[Optional[Exception]], None]] = None):
+        """Schedule a save, restarting the window if one is already pending
+
+        ``on_done`` is called once with the error, or None, when the write that
+        covers this request finishes; repeated requests with the same callback
+        are reported once.
+        """
+        if on_done is not None and on_done not in self._callbacks:
+            self._callbacks.append(on_done)
+        if self._timer:
+            self._timer.cancel()
+        self._timer = asyncio.get_event_loop().call_later(self.delay, self._start_save)
+
+    async def flush(self):
+        """Save now, replacing any pending request"""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        if self._task and not self._task.done():
+            await self._task
+        await self._save_and_notify()
+
+    def cancel(self):
+        """Drop a pending save request without writing; a save already running finishes"""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        self._callbacks.clear()
+
+    def _start_save(self):
+        self._timer = None
+        self._task = asyncio.ensure_future(self._run_save())
+
+    async def _run_save(self):
+        try:
+            await self._save_and_notify()
+        except Exception as e:
+            logger.error(f"Error in coalesced save: {e}")
+
+    async def _save_and_notify(self):
+        callbacks, self._callbacks = self._callbacks, []
+        try:
+            await self.save()
+        except Exception as e:
+            for callback in callbacks:
+                callback(e)
+            raise
+        for callback in callbacks:
+            callback(None)
+
+
 class Game:
     """Main game class that coordinates all game systems"""
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, llm: Optional[LLMInterface] = None):
         self.config = config
         self.player = None
         self.world = None
         self.combat = None
-        self.llm = LLMInterface(config)
+        # A shared LLM interface passed in by the caller is left open by close()
+        self._owns_llm = llm is None
+        self.llm = llm or LLMInterface(config)
         self.generator = ProceduralGenerator(config)
 
         self.game_running = False
@@ -39,6 +102,19 @@ class Game:
         self.save_file = None
         self.auto_save_enabled = True
 
+        # Bumped whenever displayed game state changes, so the CLI can skip redraws
+        self.state_version = 0
+        self.saver = SaveCoalescer(self.save_game, config.get("save_coalesce_delay", 0.5))
+
+        self._prefetch_task = None
+        self._prefetch_key = None
+
+    def close(self):
+        """Release the resources held by this game once it is over"""
+        self.cancel_prefetch()
+        if self._owns_llm:
+            self.llm.close()
+
     async def initialize_new_game(self, player_name: str, player_class: str):
         """Initialize a new game"""
         try:
@@ -72,8 +148,7 @@ class Game:
     async def load_game(self, save_file: str):
         """Load a saved game"""
         try:
-            with open(save_file, 'r') as f:
-                save_data = json.load(f)
+            save_data = await self._run_file_io(self._read_save_file, save_file)
 
             self.player = Player.from_dict(save_data["player"])
 
@@ -91,6 +166,7 @@ class Game:
 
             self.save_file = save_file
             self.game_running = True
+            self.state_version += 1
 
             logger.game_event("Game loaded", {"save_file": save_file})
 
@@ -105,10 +181,7 @@ class Game:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 save_name = f"save_{self.player.name}_{timestamp}.json"
 
-            save_dir = Path(self.config.get_data_dir()) / "saves"
-            save_dir.mkdir(parents=True, exist_ok=True)
-
-            save_file = save_dir / save_name
+            save_file = Path(self.config.get_data_dir()) / "saves" / save_name
 
             save_data = {
                 "version": "0.1.0",
@@ -118,8 +191,7 @@ class Game:
                 "current_location": self.current_location.to_dict() if self.current_location else None,
             }
 
-            with open(save_file, 'w') as f:
-                json.dump(save_data, f, indent=2)
+            await self._run_file_io(self._write_save_file, save_file, save_data)
 
             self.save_file = str(save_file)
             logger.game_event("Game saved", {"save_file": str(save_file)})
@@ -128,6 +200,22 @@ class Game:
             logger.error(f"Error saving game: {e}")
             raise
 
+    async def _run_file_io(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run blocking save file I/O in the default executor"""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    @staticmethod
+    def _read_save_file(save_file: str) -> Dict[str, Any]:
+        with open(save_file, 'r') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _write_save_file(save_file: Path, save_data: Dict[str, Any]):
+        save_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(save_file, 'w') as f:
+            json.dump(save_data, f, indent=2)
+
     async def move_player(self, direction: str):
         """Move player in specified direction"""
         try:
@@ -153,8 +241,10 @@ class Game:
 
             self.player.move_to(*new_location)
             self.current_location = self.world.get_location(new_location)
+            self.cancel_prefetch()
 
             await self._generate_location_content()
+            self.state_version += 1
 
             logger.game_event("Player moved", {
                 "direction": direction,
@@ -172,14 +262,30 @@ class Game:
             if not self.current_location:
                 return
 
-            player_state = self._get_player_state()
-            world_context = self.world.get_context_for_location(self.player.location)
-
-            description = await self.llm.generate_story_segment(
-                self.current_location.name,
-                player_state,
-                world_context
-            )
+            player_state, world_context, key = self._get_description_inputs()
+
+            description = None
+            # The finished prefetch is kept so unchanged state is not fetched again
+            if self._prefetch_task and self._prefetch_key == key:
+                try:
+                    description = await self._prefetch_task
+                except Exception:
+                    # Already logged by _log_prefetch_failure; fetch it again below
+                    self.cancel_prefetch()
+                else:
+                    self.llm.record_story_segment(
+                        self.current_location.name,
+                        player_state,
+                        world_context,
+                        description
+                    )
+
+            if description is None:
+                description = await self.llm.generate_story_segment(
+                    self.current_location.name,
+                    player_state,
+                    world_context
+                )
 
             from ..cli.display import DisplayManager
             display = DisplayManager()
@@ -189,6 +295,56 @@ class Game:
             logger.error(f"Error looking around: {e}")
             raise
 
+    def prefetch_look_around(self):
+        """Start generating the current location description in the background"""
+        if not self.current_location or not self.config.get("prefetch_enabled", True):
+            return
+        if not self.llm.is_available():
+            return
+
+        player_state, world_context, key = self._get_description_inputs()
+        task = self._prefetch_task
+        if task and self._prefetch_key == key and not self._prefetch_failed(task):
+            return
+
+        self.cancel_prefetch()
+        self._prefetch_key = key
+        self._prefetch_task = asyncio.ensure_future(self.llm.generate_story_segment(
+            self.current_location.name,
+            player_state,
+            world_context,
+            speculative=True
+        ))
+        self._prefetch_task.add_done_callback(self._log_prefetch_failure)
+
+    def cancel_prefetch(self):
+        """Cancel any outstanding speculative description request"""
+        if self._prefetch_task and not self._prefetch_task.done():
+            self._prefetch_task.cancel()
+        self._prefetch_task = None
+        self._prefetch_key = None
+
+    @staticmethod
+    def _prefetch_failed(task: asyncio.Future) -> bool:
+        return task.done() and (task.cancelled() or task.exception() is not None)
+
+    @staticmethod
+    def _log_prefetch_failure(task: asyncio.Future):
+        # Retrieving the exception here also stops asyncio warning that it was never retrieved
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Description prefetch failed: {task.exception()}")
+
+    def _get_description_inputs(self) -> Tuple[Dict[str, Any], Dict[str, Any], str]:
+        """Get the LLM inputs for describing the current location and a key identifying them"""
+        player_state = self._get_player_state()
+        world_context = self.world.get_context_for_location(self.player.location)
+        key = json.dumps(
+            [self.current_location.name, player_state, world_context],
+            sort_keys=True,
+            default=str
+        )
+        return player_state, world_context, key
+
     async def attack_creature(self, creature_name: str):
         """Attack a creature at current location"""
         try:
@@ -206,6 +362,7 @@ class Game:
                 return
 
             self.combat.start_combat(self.player, target_creature)
+            self.cancel_prefetch()
 
             while self.combat.is_active():
                 await self.combat.process_round()
@@ -217,6 +374,8 @@ class Game:
                     await self._handle_creature_death(target_creature)
                     break
 
+            self.state_version += 1
+
         except Exception as e:
             logger.error(f"Error in combat: {e}")
             raise
@@ -278,6 +437,7 @@ class Game:
                     self.player.restore_mana(item["effects"]["mana"])
 
                 self.player.inventory.remove(item)
+                self.state_version += 1
 
                 logger.game_event("Item used", {"item": item_name, "effects": item["effects"]})
 
@@ -300,6 +460,7 @@ class Game:
 
             self.player.inventory.append(item)
             self.items_at_location.remove(item)
+            self.state_version += 1
 
             logger.game_event("Item taken", {"item": item_name})
 
@@ -310,6 +471,7 @@ class Game:
     async def process_command(self, command: str):
         """Process custom commands"""
         try:
+            self.state_version += 1
             logger.warning(f"Unknown command: {command}")
 
         except Exception as e:
@@ -5,10 +5,12 @@ LLM Interface for Gemini 2.5 Flash integration
 import os
 import json
 import asyncio
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Sequence, Union
+from pathlib import Path
 import google.generativeai as genai
 from ..utils.logger import logger
 from ..utils.config import Config
+from ..utils.llm_cache import LLMCache, SemanticCache
 
 class LLMInterface:
     """Interface for Google Gemini 2.5 Flash model"""
@@ -18,6 +20,8 @@ class LLMInterface:
         self.model = None
         self.chat_history = []
         self.max_history = 50
+        self.cache = self._initialize_cache()
+        self.semantic_cache = self._initialize_semantic_cache()
         self._initialize_model()
     
     def _initialize_model(self):
@@ -45,12 +49,69 @@ class LLMInterface:
             logger.error(f"Failed to initialize LLM model: {e}")
             self.model = None
     
+    def _initialize_cache(self) -> Optional[LLMCache]:
+        """Initialize the persistent response cache"""
+        if not self.config.get("llm_cache_enabled", False):
+            return None
+        
+        try:
+            return LLMCache(
+                Path(self.config.get_data_dir()) / "llm_cache.db",
+                ttl_seconds=self.config.get("llm_cache_ttl", 86400),
+                max_entries=self.config.get("llm_cache_max_entries", 1000)
+            )
+        except Exception as e:
+            logger.warning(f"LLM cache unavailable: {e}")
+            return None
+    
+    def _initialize_semantic_cache(self) -> Optional[SemanticCache]:
+        """Initialize the embedding-based cache for near-duplicate prompts"""
+        if not self.config.get("semantic_cache_enabled", False):
+            return None
+        
+        return SemanticCache(
+            self._embed_text,
+            threshold=self.config.get("semantic_cache_threshold", 0.9)
+        )
+    
+    async def _embed_text(self, text: str) -> List[float]:
+        """Embed text with the configured Gemini embedding model"""
+        loop = asyncio.get_event_loop()
+        
+        def embed():
+            result = genai.embed_content(
+                model=self.config.get("embedding_model", "models/text-embedding-004"),
+                content=text,
+                task_type="semantic_similarity"
+            )
+            return result["embedding"]
+        
+        return await loop.run_in_executor(None, embed)
+    
+    def close(self):
+        """Close the response cache"""
+        if self.cache:
+            self.cache.close()
+            self.cache = None
+    
     def is_available(self) -> bool:
         """Check if LLM is available"""
         return self.model is not None
     
-    async def generate_response(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> str:
-        """Generate response from LLM"""
+    async def generate_response(self, prompt: str, context: Optional[Dict[str, Any]] = None,
+                                semantic_partition: Optional[str] = None,
+                                semantic_ignore: Sequence[str] = (),
+                                record_history: bool = True,
+                                raise_errors: bool = False) -> str:
+        """Generate response from LLM
+        
+        Passing ``semantic_partition`` allows the response to be served from the
+        semantic cache, matched only against earlier prompts in that partition.
+        Terms in ``semantic_ignore`` (e.g. the player name) are stripped from
+        the prompt before comparing. Speculative calls pass
+        ``record_history=False`` to stay out of the chat history, and
+        ``raise_errors=True`` so a failure is not mistaken for a response.
+        """
         if not self.is_available():
             return "LLM is not available. Please check your API key."
         
@@ -59,15 +120,18 @@ class LLMInterface:
             full_prompt = self._build_prompt(prompt, context)
             
             # Generate response
-            response = await self._async_generate(full_prompt)
+            response = await self._async_generate(full_prompt, semantic_partition, semantic_ignore)
             
             # Add to chat history
-            self._add_to_history(prompt, response)
+            if record_history:
+                self._add_to_history(prompt, response)
             
             logger.ai_event("Generated response", {"prompt_length": len(prompt), "response_length": len(response)})
             return response
             
         except Exception as e:
+            if raise_errors:
+                raise
             logger.error(f"Error generating LLM response: {e}")
             return f"Error: {str(e)}"
     
@@ -81,15 +145,58 @@ class LLMInterface:
         
         return full_prompt
     
-    async def _async_generate(self, prompt: str) -> str:
+    async def _async_generate(self, prompt: str, semantic_partition: Optional[str] = None,
+                              semantic_ignore: Sequence[str] = ()) -> str:
         """Async wrapper for model generation"""
+        cache_key = None
+        if self.cache:
+            model_config = self.config.get_model_config()
+            cache_key = LLMCache.make_key(
+                model=model_config["model"],
+                prompt=prompt,
+                temperature=model_config["temperature"],
+                max_tokens=model_config["max_tokens"]
+            )
+            cached = await self._run_cache_op(self.cache.get, cache_key)
+            if cached is not None:
+                logger.ai_event("Cache hit", {"prompt_length": len(prompt)})
+                return cached
+        
+        canonical_prompt = None
+        if self.semantic_cache and semantic_partition is not None:
+            canonical_prompt = SemanticCache.canonicalize(prompt, semantic_ignore)
+            try:
+                cached = await self.semantic_cache.get(semantic_partition, canonical_prompt)
+            except Exception as e:
+                logger.warning(f"Semantic cache lookup failed: {e}")
+                canonical_prompt = None
+                cached = None
+            if cached is not None:
+                logger.ai_event("Semantic cache hit", {"prompt_length": len(prompt)})
+                return cached
+        
         loop = asyncio.get_event_loop()
         
         def generate():
             response = self.model.generate_content(prompt)
             return response.text
         
-        return await loop.run_in_executor(None, generate)
+        response = await loop.run_in_executor(None, generate)
+        
+        if cache_key:
+            await self._run_cache_op(self.cache.set, cache_key, response)
+        if canonical_prompt is not None:
+            try:
+                await self.semantic_cache.set(semantic_partition, canonical_prompt, response)
+            except Exception as e:
+                logger.warning(f"Semantic cache update failed: {e}")
+        
+        return response
+    
+    async def _run_cache_op(self, func, *args) -> Any:
+        """Run a blocking response cache operation in the default executor"""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, func, *args)
     
     def _add_to_history(self, prompt: str, response: str):
         """Add interaction to chat history"""
@@ -114,9 +221,35 @@ class LLMInterface:
     async def generate_story_segment(self, 
                                    location: str, 
                                    player_state: Dict[str, Any],
-                                   world_context: Dict[str, Any]) -> str:
-        """Generate story segment for current location"""
-        prompt = f"""
+                                   world_context: Dict[str, Any],
+                                   speculative: bool = False) -> str:
+        """Generate story segment for current location
+        
+        A speculative segment raises on failure and is left out of the chat
+        history until it is shown with record_story_segment().
+        """
+        return await self.generate_response(
+            self._build_story_prompt(location, player_state, world_context),
+            semantic_partition=f"{location}@{player_state.get('location')}",
+            semantic_ignore=[player_state.get("name", "")],
+            record_history=not speculative,
+            raise_errors=speculative
+        )
+    
+    def record_story_segment(self,
+                             location: str,
+                             player_state: Dict[str, Any],
+                             world_context: Dict[str, Any],
+                             segment: str):
+        """Add a speculative story segment to the chat history once it is shown"""
+        self._add_to_history(self._build_story_prompt(location, player_state, world_context), segment)
+    
+    def _build_story_prompt(self,
+                            location: str,
+                            player_state: Dict[str, Any],
+                            world_context: Dict[str, Any]) -> str:
+        """Build the prompt for a location story segment"""
+        return f"""
         You are a master storyteller creating an immersive text adventure game.
         
         Current Location: {location}
@@ -132,8 +265,6 @@ class LLMInterface:
         
         Keep it concise but evocative (2-3 paragraphs max).
         """
-        
-        return await self.generate_response(prompt)
     
     async def generate_creature_description(self, 
                                           creature: Dict[str, Any],
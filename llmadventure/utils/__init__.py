@@ -5,5 +5,6 @@ Utility modules for LLMAdventure
 from .config import Config
 from .logger import Logger
 from .file_ops import FileOps
+from .llm_cache import LLMCache, SemanticCache
 
-__all__ = ["Config", "Logger", "FileOps"]
+__all__ = ["Config", "Logger", "FileOps", "LLMCache", "SemanticCache"]
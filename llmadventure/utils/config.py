@@ -33,11 +33,19 @@ class Config:
             "temperature": 0.7,
             "save_auto": True,
             "save_interval": 5,
+            "save_coalesce_delay": 0.5,
             "ui_theme": "default",
             "sound_enabled": False,
             "debug_mode": False,
             "log_level": "INFO",
             "data_dir": str(Path.home() / ".llmadventure" / "data"),
+            "llm_cache_enabled": False,
+            "llm_cache_ttl": 86400,
+            "llm_cache_max_entries": 1000,
+            "semantic_cache_enabled": False,
+            "semantic_cache_threshold": 0.9,
+            "embedding_model": "models/text-embedding-004",
+            "prefetch_enabled": True,
         }
 
         if os.path.exists(self.config_path):
@@ -60,10 +68,11 @@ class Config:
         """Get a configuration value"""
         return self._config.get(key, default)
     
-    def set(self, key: str, value: Any):
-        """Set a configuration value"""
+    def set(self, key: str, value: Any, persist: bool = True):
+        """Set a configuration value, saving it to the config file unless persist is False"""
         self._config[key] = value
-        self.save_config()
+        if persist:
+            self.save_config()
     
     def get_api_key(self) -> str:
         """Get the Google API key"""
@@ -0,0 +1,188 @@
+"""
+Response cache for LLM calls in LLMAdventure
+"""
+
+import re
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..utils.logger import logger
+
+class LLMCache:
+    """Exact-match LLM response cache persisted to SQLite with LRU eviction
+
+    Methods are blocking; async callers should run them in an executor.
+    """
+
+    def __init__(self, db_path: Union[str, Path], ttl_seconds: Optional[float] = 86400,
+                 max_entries: int = 1000):
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, "
+            "response TEXT NOT NULL, "
+            "created_at REAL NOT NULL, "
+            "last_accessed REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_cache_last_accessed ON llm_cache (last_accessed)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(**params: Any) -> str:
+        """Build a cache key from the parameters that determine a response"""
+        payload = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response, or None if missing or expired"""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+
+                now = time.time()
+                response, created_at = row
+                if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                    self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                    return None
+
+                self._conn.execute(
+                    "UPDATE llm_cache SET last_accessed = ? WHERE key = ?", (now, key)
+                )
+                self._conn.commit()
+                return response
+
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache read failed: {e}")
+            return None
+
+    def set(self, key: str, response: str):
+        """Store a response, evicting the least recently used entries over the limit"""
+        try:
+            with self._lock:
+                now = time.time()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, response, created_at, last_accessed) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, response, now, now)
+                )
+                count = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+                if count > self.max_entries:
+                    self._conn.execute(
+                        "DELETE FROM llm_cache WHERE key IN ("
+                        "SELECT key FROM llm_cache ORDER BY last_accessed ASC LIMIT ?)",
+                        (count - self.max_entries,)
+                    )
+                self._conn.commit()
+
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+    def clear(self):
+        """Remove all cached responses"""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+
+class SemanticCache:
+    """In-memory LLM response cache matched by embedding cosine similarity
+
+    Entries are grouped into partitions (e.g. one per location) and a prompt
+    is only ever matched against earlier prompts from the same partition.
+    """
+
+    def __init__(self, embed: Callable[[str], Awaitable[List[float]]],
+                 threshold: float = 0.9, max_entries: int = 10, max_partitions: int = 500):
+        self.embed = embed
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.max_partitions = max_partitions
+        self._partitions: "OrderedDict[str, Tuple[np.ndarray, List[str]]]" = OrderedDict()
+        self._last_embedding: Optional[Tuple[str, np.ndarray]] = None
+
+    @staticmethod
+    def canonicalize(text: str, ignore: Sequence[str] = ()) -> str:
+        """Normalize a prompt so incidental differences do not affect matching"""
+        for term in ignore:
+            if term:
+                text = re.sub(rf"\b{re.escape(term)}\b", "", text, flags=re.IGNORECASE)
+        return " ".join(text.lower().split())
+
+    async def _embed_normalized(self, text: str) -> np.ndarray:
+        # A miss in get() is followed by set() on the same text; reuse its embedding
+        if self._last_embedding and self._last_embedding[0] == text:
+            return self._last_embedding[1]
+
+        vector = np.asarray(await self.embed(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector = vector / norm
+        self._last_embedding = (text, vector)
+        return vector
+
+    async def get(self, partition: str, text: str) -> Optional[str]:
+        """Get the response for the most similar prompt in the partition above the threshold"""
+        entries = self._partitions.get(partition)
+        if entries is None:
+            return None
+
+        vectors, responses = entries
+        query = await self._embed_normalized(text)
+        scores = vectors @ query
+        best = int(np.argmax(scores))
+        if scores[best] >= self.threshold:
+            self._partitions.move_to_end(partition)
+            return responses[best]
+        return None
+
+    async def set(self, partition: str, text: str, response: str):
+        """Store a response under the embedding of its prompt"""
+        vector = await self._embed_normalized(text)
+        entries = self._partitions.get(partition)
+        if entries is None:
+            vectors, responses = vector[np.newaxis, :], [response]
+        else:
+            vectors = np.vstack([entries[0], vector])[-self.max_entries:]
+            responses = (entries[1] + [response])[-self.max_entries:]
+
+        self._partitions[partition] = (vectors, responses)
+        self._partitions.move_to_end(partition)
+        if len(self._partitions) > self.max_partitions:
+            self._partitions.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached responses"""
+        self._partitions.clear()
+
+    def __len__(self) -> int:
+        return sum(len(responses) for _, responses in self._partitions.values())
@@ -2,15 +2,22 @@
 Main CLI entry point for LLMAdventure
 """
 
+import os
 import sys
+import signal
 import asyncio
 from pathlib import Path
-from typing import Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from llmadventure.core.game import Game
 from llmadventure.utils.config import Config
 from llmadventure.utils.logger import logger
@@ -20,26 +27,59 @@ from llmadventure.cli.display import DisplayManager
 app = typer.Typer()
 console = Console()
 
+# Save directory -> (directory mtime, sorted save files) from the last listing
+_save_listing_cache: Dict[str, Tuple[int, List[Path]]] = {}
+
+# Outcomes of deferred saves, printed before the next prompt instead of over it
+_save_reports: List[Optional[Exception]] = []
+
+# Tasks that Ctrl+C interrupts, innermost last, and those it has interrupted
+_interrupt_scopes: List[asyncio.Future] = []
+_interrupted_tasks: Set[asyncio.Future] = set()
+
+
+def _build_welcome_text() -> Text:
+    """Build the welcome screen text"""
+    welcome_text = Text()
+    welcome_text.append("LLM", style="bold blue")
+    welcome_text.append("Adventure", style="bold green")
+    welcome_text.append("\n\n", style="default")
+    welcome_text.append("A CLI-based text adventure game powered by Gemini 2.5 Flash\n", style="italic")
+    welcome_text.append("Embark on procedurally generated quests and explore dynamic worlds!\n\n", style="default")
+    welcome_text.append("Press Enter to begin your adventure...", style="yellow")
+    return welcome_text
+
+
+_WELCOME_PANEL = Panel(
+    _build_welcome_text(),
+    title="[bold]Welcome to[/bold]",
+    border_style="blue",
+    padding=(1, 2)
+)
+
+_API_KEY_PANEL = Panel(
+    "[red]No Google API key found![/red]\n\n"
+    "Please set your Google API key:\n"
+    "1. Get a key from https://makersuite.google.com/app/apikey\n"
+    "2. Set environment variable: export GOOGLE_API_KEY=your_key\n"
+    "3. Or create a .env file with: GOOGLE_API_KEY=your_key",
+    title="[bold red]API Key Required[/bold red]",
+    border_style="red"
+)
+
 
 def main():
     """Main entry point for LLMAdventure"""
     try:
         config = Config()
         if not config.get_api_key():
-            console.print(Panel(
-                "[red]No Google API key found![/red]\n\n"
-                "Please set your Google API key:\n"
-                "1. Get a key from https://makersuite.google.com/app/apikey\n"
-                "2. Set environment variable: export GOOGLE_API_KEY=your_key\n"
-                "3. Or create a .env file with: GOOGLE_API_KEY=your_key",
-                title="[bold red]API Key Required[/bold red]",
-                border_style="red"
-            ))
+            console.print(_API_KEY_PANEL)
             sys.exit(1)
 
-        show_welcome_screen()
         display = DisplayManager()
         menu_system = MenuSystem(display)
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
         asyncio.run(run_game(config, display, menu_system))
         
     except KeyboardInterrupt:
@@ -51,43 +91,98 @@ def main():
         sys.exit(1)
 
 
-def show_welcome_screen():
-    """Display the welcome screen"""
-    welcome_text = Text()
-    welcome_text.append("LLM", style="bold blue")
-    welcome_text.append("Adventure", style="bold green")
-    welcome_text.append("\n\n", style="default")
-    welcome_text.append("A CLI-based text adventure game powered by Gemini 2.5 Flash\n", style="italic")
-    welcome_text.append("Embark on procedurally generated quests and explore dynamic worlds!\n\n", style="default")
-    welcome_text.append("Press Enter to begin your adventure...", style="yellow")
+async def read_input(prompt: str = "") -> str:
+    """Read a line of input, letting the event loop run while the player types
+    
+    A terminal is watched for input instead of being read in a thread, so a
+    cancelled read leaves nothing blocked on stdin. Other input (pipes, files,
+    or a loop that cannot watch stdin) is read directly.
+    """
+    console.print(prompt, end="")
+    if sys.stdin.isatty():
+        await _wait_readable(sys.stdin.fileno())
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
+async def _wait_readable(fd: int):
+    """Wait until a file descriptor has input; a terminal then has a whole line"""
+    loop = asyncio.get_event_loop()
+    ready = loop.create_future()
+    try:
+        loop.add_reader(fd, lambda: ready.done() or ready.set_result(None))
+    except NotImplementedError:
+        return
+    try:
+        await ready
+    finally:
+        loop.remove_reader(fd)
+
+
+async def _interruptible(awaitable: Awaitable[Any]) -> Any:
+    """Await a coroutine so that Ctrl+C raises KeyboardInterrupt here
     
-    console.print(Panel(
-        welcome_text,
-        title="[bold]Welcome to[/bold]",
-        border_style="blue",
-        padding=(1, 2)
-    ))
+    Without this, Ctrl+C surfaces wherever the event loop happens to be. Scopes
+    nest, and only the innermost one is interrupted. Code that blocks on input
+    must not run inside one: the signal is only acted on by the event loop.
+    """
+    loop = asyncio.get_event_loop()
+    task = asyncio.ensure_future(awaitable)
+    if not _interrupt_scopes:
+        try:
+            loop.add_signal_handler(signal.SIGINT, _on_interrupt)
+        except (NotImplementedError, RuntimeError):
+            return await task
     
-    input()
+    _interrupt_scopes.append(task)
+    try:
+        return await task
+    except asyncio.CancelledError:
+        if task in _interrupted_tasks:
+            raise KeyboardInterrupt from None
+        raise
+    finally:
+        _interrupted_tasks.discard(task)
+        _interrupt_scopes.remove(task)
+        if not _interrupt_scopes:
+            loop.remove_signal_handler(signal.SIGINT)
+
+
+def _on_interrupt():
+    task = _interrupt_scopes[-1]
+    if not task.done():
+        _interrupted_tasks.add(task)
+        task.cancel()
+
+
+async def show_welcome_screen():
+    """Display the welcome screen"""
+    console.print(_WELCOME_PANEL)
+    await read_input()
 
 
 async def run_game(config: Config, display: DisplayManager, menu_system: MenuSystem):
     """Main game loop"""
     game = None
     
+    await _interruptible(show_welcome_screen())
+    
     while True:
         try:
+            # The menus read input synchronously, so they stay outside _interruptible
             choice = await menu_system.show_main_menu()
             
             if choice == "new_game":
-                game = await start_new_game(config)
+                game = await _interruptible(start_new_game(config))
                 if game:
-                    await play_game(game, display)
+                    await _interruptible(_play_and_close(game, display))
                     
             elif choice == "load_game":
-                game = await load_game(config)
+                game = await _interruptible(load_game(config))
                 if game:
-                    await play_game(game, display)
+                    await _interruptible(_play_and_close(game, display))
                     
             elif choice == "settings":
                 await menu_system.show_settings_menu(config)
@@ -108,30 +203,42 @@ async def run_game(config: Config, display: DisplayManager, menu_system: MenuSys
             continue
 
 
+async def _play_and_close(game: Game, display: DisplayManager):
+    try:
+        await play_game(game, display)
+    finally:
+        game.close()
+
+
+PLAYER_CLASSES = ("warrior", "mage", "rogue", "ranger")
+
+# Menu number or class name -> class
+CLASS_CHOICES = {
+    **{str(i): name for i, name in enumerate(PLAYER_CLASSES, 1)},
+    **{name: name for name in PLAYER_CLASSES},
+}
+
+
 async def start_new_game(config: Config) -> Optional[Game]:
     """Start a new game"""
+    game = None
     try:
         console.print("\n[bold blue]Character Creation[/bold blue]")
         
-        name = console.input("[cyan]Enter your character's name: [/cyan]").strip()
+        name = (await read_input("[cyan]Enter your character's name: [/cyan]")).strip()
         if not name:
             name = "Adventurer"
 
-        classes = ["Warrior", "Mage", "Rogue", "Ranger"]
         console.print("\n[bold]Choose your class:[/bold]")
-        for i, class_name in enumerate(classes, 1):
-            console.print(f"{i}. {class_name}")
+        for i, class_name in enumerate(PLAYER_CLASSES, 1):
+            console.print(f"{i}. {class_name.title()}")
         
         while True:
-            try:
-                choice = int(console.input("\n[cyan]Enter your choice (1-4): [/cyan]"))
-                if 1 <= choice <= 4:
-                    player_class = classes[choice - 1].lower()
-                    break
-                else:
-                    console.print("[red]Please enter a number between 1 and 4.[/red]")
-            except ValueError:
-                console.print("[red]Please enter a valid number.[/red]")
+            choice = (await read_input("\n[cyan]Enter your choice (1-4): [/cyan]")).strip().lower()
+            player_class = CLASS_CHOICES.get(choice)
+            if player_class:
+                break
+            console.print("[red]Please enter a number between 1 and 4 or a class name.[/red]")
 
         game = Game(config)
         await game.initialize_new_game(name, player_class)
@@ -141,19 +248,45 @@ async def start_new_game(config: Config) -> Optional[Game]:
         
         return game
         
+    except KeyboardInterrupt:
+        if game:
+            game.close()
+        raise
     except Exception as e:
+        if game:
+            game.close()
         logger.error(f"Error starting new game: {e}")
         console.print(f"[red]Error starting new game: {e}[/red]")
         return None
 
 
+def _list_save_files(save_dir: Path) -> List[Path]:
+    """List save files, reusing the previous listing while the directory is unchanged"""
+    mtime = os.stat(save_dir).st_mtime_ns
+    cached = _save_listing_cache.get(str(save_dir))
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with os.scandir(save_dir) as entries:
+        names = sorted(
+            entry.name for entry in entries
+            if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+        )
+
+    save_files = [save_dir / name for name in names]
+    _save_listing_cache[str(save_dir)] = (mtime, save_files)
+    return save_files
+
+
 async def load_game(config: Config) -> Optional[Game]:
     """Load an existing game"""
+    game = None
     try:
         save_dir = Path(config.get_data_dir()) / "saves"
         save_dir.mkdir(exist_ok=True)
         
-        save_files = list(save_dir.glob("*.json"))
+        loop = asyncio.get_event_loop()
+        save_files = await loop.run_in_executor(None, _list_save_files, save_dir)
         
         if not save_files:
             console.print("[yellow]No save files found.[/yellow]")
@@ -167,7 +300,7 @@ async def load_game(config: Config) -> Optional[Game]:
 
         while True:
             try:
-                choice = int(console.input(f"\n[cyan]Enter your choice (1-{len(save_files)}): [/cyan]"))
+                choice = int(await read_input(f"\n[cyan]Enter your choice (1-{len(save_files)}): [/cyan]"))
                 if 1 <= choice <= len(save_files):
                     selected_file = save_files[choice - 1]
                     break
@@ -181,76 +314,132 @@ async def load_game(config: Config) -> Optional[Game]:
         console.print(f"\n[green]Game loaded: {selected_file.stem}[/green]")
         return game
         
+    except KeyboardInterrupt:
+        if game:
+            game.close()
+        raise
     except Exception as e:
+        if game:
+            game.close()
         logger.error(f"Error loading game: {e}")
         console.print(f"[red]Error loading game: {e}[/red]")
         return None
 
 
+async def _quit(game: Game, display: DisplayManager) -> bool:
+    game.cancel_prefetch()
+    await game.saver.flush()
+    console.print("[yellow]Game saved. Returning to main menu...[/yellow]")
+    return True
+
+
+def _report_save(error: Optional[Exception]):
+    _save_reports.append(error)
+
+
+def _print_save_reports():
+    for error in _save_reports:
+        if error is None:
+            console.print("[green]Game saved![/green]")
+        else:
+            console.print(f"[red]Error saving game: {error}[/red]")
+    _save_reports.clear()
+
+
+async def _save(game: Game, display: DisplayManager):
+    game.saver.request_save(_report_save)
+    console.print("[yellow]Saving game...[/yellow]")
+
+
+async def _help(game: Game, display: DisplayManager):
+    await display.show_help()
+
+
+async def _inventory(game: Game, display: DisplayManager):
+    await display.show_inventory(game.player)
+
+
+async def _status(game: Game, display: DisplayManager):
+    await display.show_player_status(game.player)
+
+
+async def _look(game: Game, display: DisplayManager):
+    await game.look_around()
+
+
+def _move(direction: str) -> Callable[[Game, DisplayManager], Awaitable[None]]:
+    async def handler(game: Game, display: DisplayManager):
+        await game.move_player(direction)
+    return handler
+
+
+# Exact-match commands; a handler returning True leaves the game loop
+COMMAND_HANDLERS: Dict[str, Callable[[Game, DisplayManager], Awaitable[Optional[bool]]]] = {
+    "quit": _quit, "exit": _quit, "q": _quit,
+    "save": _save,
+    "help": _help, "h": _help, "?": _help,
+    "inventory": _inventory, "i": _inventory, "inv": _inventory,
+    "status": _status, "stats": _status, "st": _status,
+    "look": _look, "l": _look,
+    "north": _move("north"), "n": _move("north"),
+    "south": _move("south"), "s": _move("south"),
+    "east": _move("east"), "e": _move("east"),
+    "west": _move("west"), "w": _move("west"),
+}
+
+# Commands taking an argument: leading verb -> name of the Game method to call
+VERB_HANDLERS: Dict[str, str] = {
+    "attack": "attack_creature",
+    "talk": "talk_to_npc",
+    "use": "use_item",
+    "take": "take_item",
+}
+
+
 async def play_game(game: Game, display: DisplayManager):
     """Main game play loop"""
+    _save_reports.clear()
     try:
-        while True:
-            await display.show_game_state(game)
-
-            command = console.input("\n[cyan]What would you like to do? [/cyan]").strip().lower()
-            
-            if command in ["quit", "exit", "q"]:
-                await game.save_game()
-                console.print("[yellow]Game saved. Returning to main menu...[/yellow]")
-                break
-                
-            elif command in ["save", "s"]:
-                await game.save_game()
-                console.print("[green]Game saved![/green]")
-                
-            elif command in ["help", "h", "?"]:
-                await display.show_help()
-                
-            elif command in ["inventory", "i", "inv"]:
-                await display.show_inventory(game.player)
-                
-            elif command in ["status", "stats", "st"]:
-                await display.show_player_status(game.player)
-                
-            elif command in ["look", "l"]:
-                await game.look_around()
-                
-            elif command in ["north", "n"]:
-                await game.move_player("north")
-            elif command in ["south", "s"]:
-                await game.move_player("south")
-            elif command in ["east", "e"]:
-                await game.move_player("east")
-            elif command in ["west", "w"]:
-                await game.move_player("west")
-                
-            elif command.startswith("attack "):
-                target = command[7:].strip()
-                await game.attack_creature(target)
-                
-            elif command.startswith("talk "):
-                npc = command[5:].strip()
-                await game.talk_to_npc(npc)
-                
-            elif command.startswith("use "):
-                item = command[4:].strip()
-                await game.use_item(item)
-                
-            elif command.startswith("take "):
-                item = command[5:].strip()
-                await game.take_item(item)
-                
-            else:
-                await game.process_command(command)
-                
+        await _interruptible(_play_loop(game, display))
     except KeyboardInterrupt:
+        game.cancel_prefetch()
         console.print("\n[yellow]Game interrupted. Saving...[/yellow]")
-        await game.save_game()
+        await game.saver.flush()
         console.print("[green]Game saved![/green]")
     except Exception as e:
         logger.error(f"Error in game loop: {e}")
         console.print(f"[red]Error: {e}[/red]")
+    finally:
+        # A save still waiting on its timer would otherwise write once the player is back at the menu
+        game.saver.cancel()
+
+
+async def _play_loop(game: Game, display: DisplayManager):
+    """Read and dispatch commands until the player quits"""
+    last_drawn = -1
+    while True:
+        if game.state_version != last_drawn:
+            await display.show_game_state(game)
+            last_drawn = game.state_version
+        _print_save_reports()
+        game.prefetch_look_around()
+
+        command = (await read_input("\n[cyan]What would you like to do? [/cyan]")).strip().lower()
+        
+        handler = COMMAND_HANDLERS.get(command)
+        if handler:
+            if await handler(game, display):
+                break
+            continue
+        
+        verb, _, argument = command.partition(" ")
+        argument = argument.strip()
+        method_name = VERB_HANDLERS.get(verb)
+        if method_name and argument:
+            await getattr(game, method_name)(argument)
+        else:
+            await game.process_command(command)
+
 
 if __name__ == "__main__":
     main()
@@ -8,7 +8,7 @@ from unittest.mock import Mock, patch, AsyncMock
 from pathlib import Path
 import tempfile
 
-from llmadventure.core.game import Game
+from llmadventure.core.game import Game, SaveCoalescer
 from llmadventure.core.player import Player, PlayerClass
 from llmadventure.core.creature import Creature
 from llmadventure.core.quest import Quest
@@ -23,6 +23,7 @@ class TestGame:
         """Create a test configuration"""
         config = Config()
         config.api_key = "test_api_key"
+        config._config["llm_cache_enabled"] = False
         return config
     
     @pytest.fixture
@@ -319,6 +320,204 @@ class TestGame:
 
         assert final_objects - initial_objects < 1000
 
+    def _prepare_location(self, game, mock_llm):
+        """Place a player at a stub location without running world generation"""
+        game.llm = mock_llm
+        game.player = Player("TestPlayer", PlayerClass.WARRIOR)
+        game.world = Mock()
+        game.world.get_context_for_location.return_value = {}
+        game.current_location = Mock()
+        game.current_location.name = "Test Location"
+        game.game_running = True
+        mock_llm.generate_story_segment.return_value = "A test description"
+        mock_llm.is_available = Mock(return_value=True)
+        mock_llm.record_story_segment = Mock()
+
+    @pytest.mark.asyncio
+    async def test_look_around_reuses_prefetch(self, game, mock_llm):
+        """Test that look uses the prefetched description and is not fetched twice"""
+        self._prepare_location(game, mock_llm)
+
+        with patch("llmadventure.cli.display.DisplayManager.show_location_description",
+                   new_callable=AsyncMock) as show:
+            game.prefetch_look_around()
+            await game.look_around()
+            game.prefetch_look_around()
+            await game.look_around()
+
+        assert mock_llm.generate_story_segment.await_count == 1
+        assert mock_llm.generate_story_segment.call_args.kwargs["speculative"] is True
+        assert mock_llm.record_story_segment.call_count == 2
+        show.assert_awaited_with("A test description", game.current_location)
+
+    @pytest.mark.asyncio
+    async def test_look_around_retries_failed_prefetch(self, game, mock_llm):
+        """Test that a failed prefetch is dropped and the description fetched again"""
+        self._prepare_location(game, mock_llm)
+        mock_llm.generate_story_segment.side_effect = [RuntimeError("API down"), "A test description"]
+
+        with patch("llmadventure.cli.display.DisplayManager.show_location_description",
+                   new_callable=AsyncMock) as show:
+            game.prefetch_look_around()
+            await game.look_around()
+
+        assert mock_llm.generate_story_segment.await_count == 2
+        assert "speculative" not in mock_llm.generate_story_segment.call_args.kwargs
+        mock_llm.record_story_segment.assert_not_called()
+        assert game._prefetch_task is None
+        show.assert_awaited_once_with("A test description", game.current_location)
+
+    @pytest.mark.asyncio
+    async def test_prefetch_restarts_after_failure(self, game, mock_llm):
+        """Test that a failed prefetch is not kept for unchanged state"""
+        self._prepare_location(game, mock_llm)
+        mock_llm.generate_story_segment.side_effect = [RuntimeError("API down"), "A test description"]
+
+        game.prefetch_look_around()
+        failed = game._prefetch_task
+        await asyncio.sleep(0)
+        game.prefetch_look_around()
+
+        assert game._prefetch_task is not failed
+        assert await game._prefetch_task == "A test description"
+
+    @pytest.mark.asyncio
+    async def test_invalid_move_keeps_prefetch(self, game, mock_llm):
+        """Test that a move that does not happen leaves the prefetch running"""
+        self._prepare_location(game, mock_llm)
+        game.prefetch_look_around()
+        prefetch = game._prefetch_task
+
+        await game.move_player("invalid")
+
+        assert game._prefetch_task is prefetch
+        game.cancel_prefetch()
+
+    @pytest.mark.asyncio
+    async def test_take_item_bumps_state_version(self, game, mock_llm):
+        """Test that taking an item marks the state as changed"""
+        self._prepare_location(game, mock_llm)
+        game.items_at_location = [{"name": "Sword"}]
+
+        await game.take_item("sword")
+
+        assert game.state_version == 1
+        assert game.player.inventory == [{"name": "Sword"}]
+
+    @pytest.mark.asyncio
+    async def test_missing_item_keeps_state_version(self, game, mock_llm):
+        """Test that failing to take an item leaves the state unchanged"""
+        self._prepare_location(game, mock_llm)
+        game.items_at_location = []
+
+        await game.take_item("sword")
+
+        assert game.state_version == 0
+
+    @pytest.mark.asyncio
+    async def test_move_bumps_state_version(self, game, mock_llm):
+        """Test that a valid move marks the state as changed"""
+        self._prepare_location(game, mock_llm)
+        game.world.has_location.return_value = True
+
+        with patch.object(game, "_generate_location_content", new_callable=AsyncMock):
+            await game.move_player("north")
+
+        assert game.state_version == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_move_keeps_state_version(self, game, mock_llm):
+        """Test that an invalid move leaves the state unchanged"""
+        self._prepare_location(game, mock_llm)
+
+        await game.move_player("invalid")
+
+        assert game.state_version == 0
+
+
+    def test_close_releases_owned_llm(self, game):
+        """Test that closing a game closes the LLM interface it created"""
+        with patch.object(game.llm, "close") as close:
+            game.close()
+
+        close.assert_called_once()
+
+    def test_close_keeps_shared_llm(self, config):
+        """Test that closing a game leaves a caller-supplied LLM interface open"""
+        shared_llm = Mock()
+        game = Game(config, shared_llm)
+
+        game.close()
+
+        shared_llm.close.assert_not_called()
+
+class TestSaveCoalescer:
+    """Test cases for the SaveCoalescer class"""
+
+    @pytest.mark.asyncio
+    async def test_rapid_requests_write_once(self):
+        """Test that requests within the window collapse into one save"""
+        save = AsyncMock()
+        saver = SaveCoalescer(save, delay=0.01)
+
+        for _ in range(5):
+            saver.request_save()
+        await asyncio.sleep(0.05)
+
+        save.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_outcome_is_reported_once(self):
+        """Test that a repeated callback hears about the write once"""
+        saver = SaveCoalescer(AsyncMock(), delay=0.01)
+        on_done = Mock()
+
+        saver.request_save(on_done)
+        saver.request_save(on_done)
+        await asyncio.sleep(0.05)
+
+        on_done.assert_called_once_with(None)
+
+    @pytest.mark.asyncio
+    async def test_failure_is_reported(self):
+        """Test that a failed deferred save reaches the callback"""
+        error = IOError("disk full")
+        saver = SaveCoalescer(AsyncMock(side_effect=error), delay=0.01)
+        on_done = Mock()
+
+        saver.request_save(on_done)
+        await asyncio.sleep(0.05)
+
+        on_done.assert_called_once_with(error)
+
+    @pytest.mark.asyncio
+    async def test_flush_saves_immediately(self):
+        """Test that flush writes now and cancels the pending request"""
+        save = AsyncMock()
+        saver = SaveCoalescer(save, delay=0.01)
+        on_done = Mock()
+
+        saver.request_save(on_done)
+        await saver.flush()
+        await asyncio.sleep(0.05)
+
+        save.assert_awaited_once()
+        on_done.assert_called_once_with(None)
+
+    @pytest.mark.asyncio
+    async def test_cancel_drops_pending_request(self):
+        """Test that cancel stops a pending save from being written"""
+        save = AsyncMock()
+        saver = SaveCoalescer(save, delay=0.01)
+        on_done = Mock()
+
+        saver.request_save(on_done)
+        saver.cancel()
+        await asyncio.sleep(0.05)
+
+        save.assert_not_awaited()
+        on_done.assert_not_called()
+
 
 class TestGameIntegration:
     """Integration tests for the Game class"""
@@ -0,0 +1,140 @@
+"""
+Tests for the LLM response caches
+"""
+
+import pytest
+from unittest.mock import patch
+
+from llmadventure.utils.llm_cache import LLMCache, SemanticCache
+
+
+class TestLLMCache:
+    """Test cases for the LLMCache class"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a cache backed by a temporary database"""
+        cache = LLMCache(tmp_path / "llm_cache.db", ttl_seconds=60, max_entries=2)
+        yield cache
+        cache.close()
+
+    def test_make_key_is_stable(self):
+        """Test that keys ignore parameter order and depend on values"""
+        key = LLMCache.make_key(model="m", prompt="p", temperature=0.7)
+
+        assert key == LLMCache.make_key(temperature=0.7, prompt="p", model="m")
+        assert key != LLMCache.make_key(model="m", prompt="p", temperature=0.8)
+
+    def test_set_and_get(self, cache):
+        """Test storing and retrieving a response"""
+        cache.set("key", "response")
+
+        assert cache.get("key") == "response"
+        assert cache.get("missing") is None
+
+    def test_expired_entry_is_dropped(self, cache):
+        """Test that entries older than the TTL are not returned"""
+        with patch("llmadventure.utils.llm_cache.time.time", return_value=1000.0):
+            cache.set("key", "response")
+
+        with patch("llmadventure.utils.llm_cache.time.time", return_value=1061.0):
+            assert cache.get("key") is None
+
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self, cache):
+        """Test that the least recently used entry goes when over capacity"""
+        cache.ttl_seconds = None
+        with patch("llmadventure.utils.llm_cache.time.time", return_value=1.0):
+            cache.set("a", "1")
+        with patch("llmadventure.utils.llm_cache.time.time", return_value=2.0):
+            cache.set("b", "2")
+        with patch("llmadventure.utils.llm_cache.time.time", return_value=3.0):
+            cache.get("a")
+        with patch("llmadventure.utils.llm_cache.time.time", return_value=4.0):
+            cache.set("c", "3")
+
+        assert len(cache) == 2
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert cache.get("c") == "3"
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that responses survive reopening the database"""
+        db_path = tmp_path / "llm_cache.db"
+        first = LLMCache(db_path)
+        first.set("key", "response")
+        first.close()
+
+        second = LLMCache(db_path)
+        try:
+            assert second.get("key") == "response"
+        finally:
+            second.close()
+
+
+class TestSemanticCache:
+    """Test cases for the SemanticCache class"""
+
+    @pytest.fixture
+    def embed_calls(self):
+        """Record the texts passed to the embedding function"""
+        return []
+
+    @pytest.fixture
+    def cache(self, embed_calls):
+        """Create a cache with a deterministic bag-of-letters embedding"""
+        async def embed(text):
+            embed_calls.append(text)
+            return [text.count(letter) for letter in "abcdefghijklmnopqrstuvwxyz"]
+
+        return SemanticCache(embed, threshold=0.99, max_entries=2)
+
+    def test_canonicalize_strips_whole_words_only(self):
+        """Test that ignored terms are only removed as whole words"""
+        canonical = SemanticCache.canonicalize("Hero the hero HEROic  x", ["hero"])
+
+        assert canonical == "the heroic x"
+
+    @pytest.mark.asyncio
+    async def test_similar_prompt_hits(self, cache):
+        """Test that a near-identical prompt in the same partition is served"""
+        await cache.set("town", "a quiet town square", "response")
+
+        assert await cache.get("town", "a quiet town square ") == "response"
+
+    @pytest.mark.asyncio
+    async def test_partitions_are_isolated(self, cache):
+        """Test that prompts never match across partitions"""
+        await cache.set("town", "a quiet town square", "response")
+
+        assert await cache.get("forest", "a quiet town square") is None
+
+    @pytest.mark.asyncio
+    async def test_dissimilar_prompt_misses(self, cache):
+        """Test that a prompt below the threshold is not served"""
+        await cache.set("town", "a quiet town square", "response")
+
+        assert await cache.get("town", "zzz") is None
+
+    @pytest.mark.asyncio
+    async def test_miss_then_set_embeds_once(self, cache, embed_calls):
+        """Test that set() reuses the embedding computed by a missed get()"""
+        await cache.set("town", "first", "one")
+        embed_calls.clear()
+
+        assert await cache.get("town", "second") is None
+        await cache.set("town", "second", "two")
+
+        assert embed_calls == ["second"]
+
+    @pytest.mark.asyncio
+    async def test_partition_keeps_newest_entries(self, cache):
+        """Test that each partition is capped at max_entries"""
+        await cache.set("town", "aaaa", "1")
+        await cache.set("town", "bbbb", "2")
+        await cache.set("town", "cccc", "3")
+
+        assert len(cache) == 2
+        assert await cache.get("town", "aaaa") is None
+        assert await cache.get("town", "cccc") == "3"
@@ -0,0 +1,278 @@
+"""
+Tests for the CLI in main.py
+"""
+
+import os
+import sys
+import signal
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+import main
+from llmadventure.core.game import Game
+
+
+class TestCommandRouting:
+    """Test cases for the play loop command dispatch"""
+
+    @pytest.fixture
+    def game(self):
+        """Create a mock game"""
+        game = Mock(spec=Game)
+        game.state_version = 0
+        game.player = Mock()
+        game.saver = Mock()
+        game.saver.flush = AsyncMock()
+        return game
+
+    @pytest.fixture
+    def display(self):
+        """Create a mock display"""
+        return AsyncMock()
+
+    async def run_commands(self, game, display, *commands):
+        """Feed commands to the play loop, followed by quit"""
+        inputs = iter(commands + ("quit",))
+
+        async def read_input(prompt=""):
+            return next(inputs)
+
+        with patch.object(main, "read_input", side_effect=read_input):
+            await main._play_loop(game, display)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("command,direction", [
+        ("n", "north"), ("north", "north"),
+        ("s", "south"), ("south", "south"),
+        ("e", "east"), ("w", "west"),
+    ])
+    async def test_movement_commands(self, game, display, command, direction):
+        """Test that movement commands and aliases move the player"""
+        await self.run_commands(game, display, command)
+
+        game.move_player.assert_awaited_once_with(direction)
+
+    @pytest.mark.asyncio
+    async def test_save_is_not_aliased_to_s(self, game, display):
+        """Test that 's' moves south rather than saving"""
+        await self.run_commands(game, display, "s")
+
+        game.saver.request_save.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_save_command_requests_save(self, game, display):
+        """Test that save goes through the save coalescer"""
+        await self.run_commands(game, display, "save")
+
+        game.saver.request_save.assert_called_once_with(main._report_save)
+
+    @pytest.mark.asyncio
+    async def test_save_outcome_is_printed_before_next_prompt(self, game, display):
+        """Test that a deferred save is reported with the next prompt, not over the current one"""
+        inputs = iter(["look", "quit"])
+        printed = []
+
+        async def read_input(prompt=""):
+            printed.append(prompt)
+            if len(printed) == 1:
+                main._report_save(None)
+            return next(inputs)
+
+        with patch.object(main, "read_input", side_effect=read_input), \
+                patch.object(main, "console") as console:
+            console.print.side_effect = lambda message, **kwargs: printed.append(message)
+            await main._play_loop(game, display)
+
+        prompt = "\n[cyan]What would you like to do? [/cyan]"
+        assert printed[:3] == [prompt, "[green]Game saved![/green]", prompt]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("command", ["quit", "exit", "q"])
+    async def test_quit_saves_and_leaves_loop(self, game, display, command):
+        """Test that quit aliases flush a save and end the loop"""
+        async def read_input(prompt=""):
+            return command
+
+        with patch.object(main, "read_input", side_effect=read_input):
+            await main._play_loop(game, display)
+
+        game.saver.flush.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_info_commands(self, game, display):
+        """Test that information commands reach the display"""
+        await self.run_commands(game, display, "help", "i", "stats", "look")
+
+        display.show_help.assert_awaited_once()
+        display.show_inventory.assert_awaited_once_with(game.player)
+        display.show_player_status.assert_awaited_once_with(game.player)
+        game.look_around.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("command,method,argument", [
+        ("attack goblin", "attack_creature", "goblin"),
+        ("talk old man", "talk_to_npc", "old man"),
+        ("use health potion", "use_item", "health potion"),
+        ("take  sword", "take_item", "sword"),
+    ])
+    async def test_verb_commands(self, game, display, command, method, argument):
+        """Test that verb commands call the matching game method with their argument"""
+        await self.run_commands(game, display, command)
+
+        getattr(game, method).assert_awaited_once_with(argument)
+        game.process_command.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_verb_without_argument(self, game, display):
+        """Test that a bare verb falls through to process_command"""
+        await self.run_commands(game, display, "attack")
+
+        game.attack_creature.assert_not_awaited()
+        game.process_command.assert_awaited_once_with("attack")
+
+    @pytest.mark.asyncio
+    async def test_unchanged_state_is_not_redrawn(self, game, display):
+        """Test that the game state is only redrawn after it changes"""
+        async def move_player(direction):
+            game.state_version += 1
+
+        game.move_player.side_effect = move_player
+
+        await self.run_commands(game, display, "help", "n", "help")
+
+        assert display.show_game_state.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_command(self, game, display):
+        """Test that unrecognised commands fall through to process_command"""
+        await self.run_commands(game, display, "dance")
+
+        game.process_command.assert_awaited_once_with("dance")
+
+
+class TestSaveListing:
+    """Test cases for the cached save file listing"""
+
+    def test_unchanged_directory_reuses_listing(self, tmp_path):
+        """Test that the directory is only scanned once while it is unchanged"""
+        (tmp_path / "a.json").write_text("{}")
+
+        with patch("main.os.scandir", wraps=main.os.scandir) as scandir:
+            first = main._list_save_files(tmp_path)
+            second = main._list_save_files(tmp_path)
+
+        assert first == [tmp_path / "a.json"]
+        assert second is first
+        assert scandir.call_count == 1
+
+    def test_new_save_refreshes_listing(self, tmp_path):
+        """Test that adding a save file invalidates the cached listing"""
+        (tmp_path / "b.json").write_text("{}")
+        main._list_save_files(tmp_path)
+
+        (tmp_path / "a.json").write_text("{}")
+        (tmp_path / "notes.txt").write_text("")
+        # Make the directory mtime change even on coarse-grained filesystems
+        stat = tmp_path.stat()
+        main.os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert main._list_save_files(tmp_path) == [tmp_path / "a.json", tmp_path / "b.json"]
+
+
+def send_interrupt():
+    """Deliver Ctrl+C to this process once the event loop is idle"""
+    asyncio.get_event_loop().call_later(0.01, os.kill, os.getpid(), signal.SIGINT)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="SIGINT is only routed through the event loop on Unix")
+class TestInterrupts:
+    """Test cases for routing Ctrl+C to the awaiting code"""
+
+    @pytest.mark.asyncio
+    async def test_interrupt_raises_keyboard_interrupt(self):
+        """Test that Ctrl+C becomes KeyboardInterrupt and the handler is removed"""
+        send_interrupt()
+
+        with pytest.raises(KeyboardInterrupt):
+            await main._interruptible(asyncio.sleep(10))
+
+        assert signal.getsignal(signal.SIGINT) is signal.default_int_handler
+
+    @pytest.mark.asyncio
+    async def test_innermost_scope_is_interrupted(self):
+        """Test that nested scopes only interrupt the innermost one"""
+        async def outer():
+            try:
+                await main._interruptible(asyncio.sleep(10))
+            except KeyboardInterrupt:
+                return "inner interrupted"
+
+        send_interrupt()
+
+        assert await main._interruptible(outer()) == "inner interrupted"
+
+    @pytest.mark.asyncio
+    async def test_interrupted_play_saves(self):
+        """Test that Ctrl+C during play saves and returns normally"""
+        game = Mock(spec=Game)
+        game.saver = Mock()
+        game.saver.flush = AsyncMock()
+        async def play_loop(game, display):
+            send_interrupt()
+            await asyncio.sleep(10)
+
+        with patch.object(main, "_play_loop", side_effect=play_loop):
+            await main.play_game(game, AsyncMock())
+
+        game.cancel_prefetch.assert_called_once()
+        game.saver.flush.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_play_drops_pending_save(self):
+        """Test that a save still waiting when play fails is not written later"""
+        game = Mock(spec=Game)
+        game.saver = Mock()
+
+        with patch.object(main, "_play_loop", side_effect=RuntimeError("boom")), \
+                patch.object(main, "console"):
+            await main.play_game(game, AsyncMock())
+
+        game.saver.cancel.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_interrupted_prompt_returns_to_menu(self):
+        """Test that Ctrl+C at a prompt outside play goes back to the main menu"""
+        menu_system = Mock()
+        menu_system.show_main_menu = AsyncMock(side_effect=["new_game", "quit"])
+
+        async def start_new_game(config):
+            send_interrupt()
+            await asyncio.sleep(10)
+
+        with patch.object(main, "show_welcome_screen", new_callable=AsyncMock), \
+                patch.object(main, "start_new_game", side_effect=start_new_game), \
+                patch.object(main, "console") as console:
+            await main.run_game(Mock(), Mock(), menu_system)
+
+        assert menu_system.show_main_menu.await_count == 2
+        console.print.assert_any_call("\n[yellow]Returning to main menu...[/yellow]")
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not hasattr(os, "openpty"), reason="needs a pseudo-terminal")
+    async def test_cancelled_read_leaves_terminal_unwatched(self):
+        """Test that an abandoned read stops watching the terminal and loses no input"""
+        master, slave = os.openpty()
+        with os.fdopen(slave, "r") as terminal, patch.object(sys, "stdin", terminal), \
+                patch.object(main, "console"):
+            read = asyncio.ensure_future(main.read_input())
+            await asyncio.sleep(0.01)
+            read.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await read
+
+            assert not asyncio.get_event_loop().remove_reader(slave)
+
+            os.write(master, b"look\n")
+            assert await main.read_input() == "look"
+        os.close(master)